@@ -1,7 +1,12 @@
 import csv
-from statistics import mean, median
+import io
+import sys
+from bisect import bisect_left, bisect_right, insort
+from collections import defaultdict
 from datetime import datetime
-from typing import List, Optional
+from itertools import groupby
+from operator import itemgetter
+from typing import Dict, List, NamedTuple, Optional, Tuple
 
 class SingletonMeta(type):
     """Metaclass for creating a singleton class."""
@@ -12,25 +17,26 @@ class SingletonMeta(type):
             cls._instances[cls] = super().__call__(*args, **kwargs)
         return cls._instances[cls]
 
-class PlayerRecord:
-    """Class representing an individual player's statistics."""
-    def __init__(self, name: str, team: str, goals: int, assists: int):
-        self.name = name
-        self.team = team
-        self.goals = goals
-        self.assists = assists
+class PlayerRecord(NamedTuple):
+    """Immutable record of an individual player's statistics."""
+    name: str
+    team: str
+    goals: int
+    assists: int
 
     def edit(self, name: Optional[str] = None, team: Optional[str] = None,
-             goals: Optional[int] = None, assists: Optional[int] = None):
-        """Edit the fields of a PlayerRecord."""
+             goals: Optional[int] = None, assists: Optional[int] = None) -> 'PlayerRecord':
+        """Return a copy of the PlayerRecord with the given fields replaced."""
+        changes = {}
         if name:
-            self.name = name
+            changes['name'] = name
         if team:
-            self.team = team
+            changes['team'] = team
         if goals is not None:
-            self.goals = goals
+            changes['goals'] = goals
         if assists is not None:
-            self.assists = assists
+            changes['assists'] = assists
+        return self._replace(**changes)
 
     def display(self):
         print(f"Name: {self.name}, Team: {self.team}, Goals: {self.goals}, Assists: {self.assists}")
@@ -41,21 +47,79 @@ class PlayerManager(metaclass=SingletonMeta):
     def __init__(self):
         """Initialize a PlayerManager object."""
         self.players = []
+        # Each player gets a sequence number that only grows, so ordering by it
+        # matches roster order even after deletes shift the list positions.
+        self._seqs: List[int] = []
+        self._next_seq = 0
+        self._team_index: Dict[str, List[Tuple[int, PlayerRecord]]] = defaultdict(list)
+        self._by_goals: List[Tuple[int, int, PlayerRecord]] = []
+        self._sorted_assists: List[int] = []
+        self._goal_sum = 0
+
+    def _rebuild_indexes(self):
+        """Rebuild the lookup indexes from the current player list."""
+        self._seqs = list(range(len(self.players)))
+        self._next_seq = len(self.players)
+        self._team_index = defaultdict(list)
+        for seq, player in zip(self._seqs, self.players):
+            self._team_index[player.team].append((seq, player))
+        self._by_goals = sorted((player.goals, seq, player) for seq, player in zip(self._seqs, self.players))
+        self._sorted_assists = sorted(player.assists for player in self.players)
+        self._goal_sum = sum(player.goals for player in self.players)
+
+    def _unindex_team(self, index: int):
+        """Remove the player at the given roster index from its team bucket."""
+        team = self.players[index].team
+        bucket = self._team_index[team]
+        del bucket[bisect_left(bucket, (self._seqs[index],))]
+        if not bucket:
+            del self._team_index[team]
+
+    def _unindex_goals(self, index: int):
+        """Remove the player at the given roster index from the goals-ordered index."""
+        player = self.players[index]
+        del self._by_goals[bisect_left(self._by_goals, (player.goals, self._seqs[index]))]
+
+    def _index_stats(self, player: PlayerRecord):
+        """Add a player's goals and assists to the running aggregates."""
+        insort(self._sorted_assists, player.assists)
+        self._goal_sum += player.goals
+
+    def _unindex_stats(self, player: PlayerRecord):
+        """Remove a player's goals and assists from the running aggregates."""
+        del self._sorted_assists[bisect_left(self._sorted_assists, player.assists)]
+        self._goal_sum -= player.goals
 
     def add_player(self, player: PlayerRecord):
         """Add a new player to the list."""
+        player = player._replace(team=sys.intern(player.team))
         self.players.append(player)
+        self._seqs.append(self._next_seq)
+        self._next_seq += 1
+        self._team_index[player.team].append((self._seqs[-1], player))
+        insort(self._by_goals, (player.goals, self._seqs[-1], player))
+        self._index_stats(player)
         print("Player added successfully.")
 
     def edit_player(self, index: int, updated_player: PlayerRecord):
         """Edit a player in the manager."""
         if 0 <= index < len(self.players):
-            self.players[index].edit(
+            player = self.players[index]
+            updated = player.edit(
                 name=updated_player.name,
-                team=updated_player.team,
+                team=sys.intern(updated_player.team) if updated_player.team else None,
                 goals=updated_player.goals,
                 assists=updated_player.assists
             )
+            self._unindex_team(index)
+            self._unindex_goals(index)
+            self._unindex_stats(player)
+            self.players[index] = updated
+            # Reusing the old sequence number puts the record back at its roster
+            # position within its team and among players with equal goals.
+            insort(self._team_index[updated.team], (self._seqs[index], updated))
+            insort(self._by_goals, (updated.goals, self._seqs[index], updated))
+            self._index_stats(updated)
             print("Player updated successfully.")
         else:
             print("Invalid index.")
@@ -63,7 +127,12 @@ class PlayerManager(metaclass=SingletonMeta):
     def delete_player(self, index: int):
         """Delete a player from the manager."""
         if 0 <= index < len(self.players):
+            player = self.players[index]
+            self._unindex_team(index)
+            self._unindex_goals(index)
+            self._unindex_stats(player)
             del self.players[index]
+            del self._seqs[index]
             print("Player deleted successfully.")
         else:
             print("Invalid index.")
@@ -71,98 +140,105 @@ class PlayerManager(metaclass=SingletonMeta):
     def calculate_average_goals(self) -> float:
         """Calculate the average goals scored by players."""
         if self.players:
-            return mean(player.goals for player in self.players)
+            return self._goal_sum / len(self.players)
         return 0.0
 
     def calculate_median_assists(self) -> float:
         """Calculate the median of assists."""
         if self.players:
-            return median(player.assists for player in self.players)
+            assists = self._sorted_assists
+            mid = len(assists) // 2
+            if len(assists) % 2:
+                return assists[mid]
+            return (assists[mid - 1] + assists[mid]) / 2
         return 0.0
 
     def save_to_csv(self, filename: str):
         """Save player statistics to a CSV file."""
-        with open(filename, 'w', newline='') as csvfile:
-            fieldnames = ['Name', 'Team', 'Goals', 'Assists']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            for player in self.players:
-                writer.writerow({
-                    'Name': player.name,
-                    'Team': player.team,
-                    'Goals': player.goals,
-                    'Assists': player.assists
-                })
+        # A 1 MiB buffer keeps large rosters from flushing every 8 KiB.
+        with open(filename, 'w', newline='', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(('Name', 'Team', 'Goals', 'Assists'))
+            writer.writerows((player.name, player.team, player.goals, player.assists)
+                             for player in self.players)
 
     def load_from_csv(self, filename: str):
         """Load player statistics from a CSV file."""
-        self.players = []
         with open(filename, newline='') as csvfile:
-            reader = csv.DictReader(csvfile)
-            for row in reader:
-                player = PlayerRecord(
-                    name=row['Name'],
-                    team=row['Team'],
-                    goals=int(row['Goals']),
-                    assists=int(row['Assists'])
-                )
-                self.players.append(player)
+            reader = csv.reader(csvfile)
+            next(reader, None)  # Skip the Name,Team,Goals,Assists header.
+            # filter() drops blank lines, which DictReader used to skip for us.
+            # Team names repeat heavily, so intern them to keep one copy per team.
+            players = [
+                PlayerRecord(name, sys.intern(team), int(goals), int(assists))
+                for name, team, goals, assists in filter(None, reader)
+            ]
+        self.players = players
+        self._rebuild_indexes()
 
     def filter_by_team(self, team: str) -> List[PlayerRecord]:
         """Filter players by team."""
-        return [player for player in self.players if player.team == team]
+        return [player for _, player in self._team_index.get(team, ())]
 
     def filter_by_goal_range(self, min_goals: int, max_goals: int, ascending: bool = True) -> List[PlayerRecord]:
         """Filter players by goal range and order the result."""
-        filtered_players = [player for player in self.players if min_goals <= player.goals <= max_goals]
-        filtered_players.sort(key=lambda x: x.goals, reverse=not ascending)
-        return filtered_players
+        lo = bisect_left(self._by_goals, (min_goals,))
+        hi = bisect_right(self._by_goals, (max_goals, float('inf')), lo=lo)
+        entries = self._by_goals[lo:hi]
+        if not ascending:
+            # Reverse the goal groups but keep tied players in roster order,
+            # as a stable sort with reverse=True would.
+            groups = [list(group) for _, group in groupby(entries, key=itemgetter(0))]
+            entries = [entry for group in reversed(groups) for entry in group]
+        return [player for _, _, player in entries]
 class ConsoleApp:
-    def __init__(self, player_manager):
+    _MENU_TEXT = "\n".join([
+        "-" * 90,
+        "\nMenu:",
+        "1. Add Player",
+        "2. Edit Player",
+        "3. Delete Player",
+        "4. Display All Players",
+        "5. Calculate Average Goals and Median Assists",
+        "6. Filter by Team",
+        "7. Filter by Goal Range",
+        "8. Save Players to CSV",
+        "9. Load Players from CSV",
+        "10. Exit",
+    ]) + "\n"
+    _ROW_FORMAT = "{:<5} {:<20} {:<15} {:<10} {:<10}".format
+
+    def __init__(self, player_manager, legacy_prompts: bool = False):
         self.player_manager = player_manager
+        self.legacy_prompts = legacy_prompts
+        self._dispatch = {
+            '1': self.add_player,
+            '2': self.edit_player,
+            '3': self.delete_player,
+            '4': self.display_all_players,
+            '5': self.calculate_average_goals_and_median_assists,
+            '6': self.filter_by_team,
+            '7': self.filter_by_goal_range,
+            '8': self.save_to_csv,
+            '9': self.load_from_csv,
+        }
 
     def display_menu(self):
-        print("-" * 90)
-        print("\nMenu:")
-        print("1. Add Player")
-        print("2. Edit Player")
-        print("3. Delete Player")
-        print("4. Display All Players")
-        print("5. Calculate Average Goals and Median Assists")
-        print("6. Filter by Team")
-        print("7. Filter by Goal Range")
-        print("8. Save Players to CSV")
-        print("9. Load Players from CSV")
-        print("10. Exit")
+        sys.stdout.write(self._MENU_TEXT)
 
     def run(self):
         while True:
             self.display_menu()
             choice = input("Enter your choice: ")
 
-            if choice == '1':
-                self.add_player()
-            elif choice == '2':
-                self.edit_player()
-            elif choice == '3':
-                self.delete_player()
-            elif choice == '4':
-                self.display_all_players()
-            elif choice == '5':
-                self.calculate_average_goals_and_median_assists()
-            elif choice == '6':
-                self.filter_by_team()
-            elif choice == '7':
-                self.filter_by_goal_range()
-            elif choice == '8':
-                self.save_to_csv()
-            elif choice == '9':
-                self.load_from_csv()
-            elif choice == '10':
+            if choice == '10':
                 print("Exiting...")
                 break
-            else:
+            action = self._dispatch.get(choice)
+            if action is None:
                 print("Invalid choice. Please try again.")
+            else:
+                action()
 
     def add_player(self):
         """Add a player based on user input."""
@@ -177,26 +253,44 @@ class ConsoleApp:
             print(f"Error: {e}. Please enter valid input.")
 
     def edit_player(self):
-        index = int(input("Enter the index of the player to edit: "))
-        if 0 <= index < len(self.player_manager.players):
-            player = self.player_manager.players[index]
-            print("\nCurrent Player Details:")
-            player.display()
+        try:
+            index = int(input("Enter the index of the player to edit: "))
+            if 0 <= index < len(self.player_manager.players):
+                player = self.player_manager.players[index]
+                print("\nCurrent Player Details:")
+                player.display()
 
-            print("\nEnter the updated details (leave blank to keep the existing value):")
-            updated_name = input(f"Updated name ({player.name}): ") or player.name
-            updated_team = input(f"Updated team ({player.team}): ") or player.team
-            updated_goals = input(f"Updated goals ({player.goals}): ")
-            updated_assists = input(f"Updated assists ({player.assists}): ")
+                print("\nEnter the updated details (leave blank to keep the existing value):")
+                updated_name, updated_team, updated_goals, updated_assists = self._prompt_updates(player)
+                updated_name = updated_name or player.name
+                updated_team = updated_team or player.team
+                updated_goals = int(updated_goals) if updated_goals else player.goals
+                updated_assists = int(updated_assists) if updated_assists else player.assists
 
-            updated_goals = int(updated_goals) if updated_goals else player.goals
-            updated_assists = int(updated_assists) if updated_assists else player.assists
+                updated_player = PlayerRecord(updated_name, updated_team, updated_goals, updated_assists)
+                self.player_manager.edit_player(index, updated_player)
+                print("Player updated successfully.")
+            else:
+                print("Invalid index.")
+        except ValueError as e:
+            print(f"Error: {e}. Please enter valid input.")
 
-            updated_player = PlayerRecord(updated_name, updated_team, updated_goals, updated_assists)
-            self.player_manager.edit_player(index, updated_player)
-            print("Player updated successfully.")
-        else:
-            print("Invalid index.")
+    def _prompt_updates(self, player):
+        """Read the updated name, team, goals and assists, one line or one prompt each."""
+        if self.legacy_prompts:
+            return (input(f"Updated name ({player.name}): "),
+                    input(f"Updated team ({player.team}): "),
+                    input(f"Updated goals ({player.goals}): "),
+                    input(f"Updated assists ({player.assists}): "))
+        # The line is parsed as CSV, so names and teams containing commas can be quoted.
+        current = io.StringIO()
+        csv.writer(current, lineterminator='').writerow(player)
+        line = input(f"Updated name,team,goals,assists ({current.getvalue()}): ")
+        parts = [part.strip() for part in next(csv.reader([line], skipinitialspace=True), [])]
+        if len(parts) > 4:
+            raise ValueError(f"expected at most 4 fields, got {len(parts)}")
+        parts += [''] * (4 - len(parts))
+        return parts
 
     def delete_player(self):
         index = int(input("Enter the index of the player to delete: "))
@@ -210,11 +304,12 @@ class ConsoleApp:
         if not self.player_manager.players:
             print("No players to display.")
         else:
-            print("\nAll Players:")
-            print("{:<5} {:<20} {:<15} {:<10} {:<10}".format("Index", "Name", "Team", "Goals", "Assists"))
-            print("-" * 90)
-            for index, player in enumerate(self.player_manager.players):
-                print("{:<5} {:<20} {:<15} {:<10} {:<10}".format(index, player.name, player.team, player.goals, player.assists))
+            row_format = self._ROW_FORMAT
+            lines = ["\nAll Players:", row_format("Index", "Name", "Team", "Goals", "Assists"), "-" * 90]
+            lines.extend(row_format(index, player.name, player.team, player.goals, player.assists)
+                         for index, player in enumerate(self.player_manager.players))
+            lines.append("")
+            sys.stdout.write("\n".join(lines))
 
     def calculate_average_goals_and_median_assists(self):
         average_goals = self.player_manager.calculate_average_goals()
@@ -255,5 +350,5 @@ class ConsoleApp:
 
 if __name__ == "__main__":
     manager = PlayerManager()
-    console_app = ConsoleApp(manager)
+    console_app = ConsoleApp(manager, legacy_prompts='--legacy' in sys.argv[1:])
     console_app.run()
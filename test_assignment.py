@@ -0,0 +1,67 @@
+import contextlib
+import io
+import os
+import random
+import unittest
+from operator import attrgetter
+
+from assignment import PlayerManager, PlayerRecord, SingletonMeta
+
+PLAYERS_CSV = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'players.csv')
+
+
+class PlayerManagerTest(unittest.TestCase):
+    def setUp(self):
+        SingletonMeta._instances.pop(PlayerManager, None)
+        self.manager = PlayerManager()
+        # The manager reports every change on stdout; keep test output quiet.
+        quiet = contextlib.redirect_stdout(io.StringIO())
+        quiet.__enter__()
+        self.addCleanup(quiet.__exit__, None, None, None)
+
+    def assert_goal_range_matches_sort(self, min_goals, max_goals):
+        for ascending in (True, False):
+            expected = [player for player in sorted(self.manager.players, key=attrgetter('goals'),
+                                                    reverse=not ascending)
+                        if min_goals <= player.goals <= max_goals]
+            actual = self.manager.filter_by_goal_range(min_goals, max_goals, ascending)
+            self.assertEqual([id(player) for player in actual], [id(player) for player in expected])
+
+    def test_goal_range_keeps_ties_in_roster_order(self):
+        self.manager.load_from_csv(PLAYERS_CSV)
+        names = [player.name for player in self.manager.filter_by_goal_range(28, 30, False)]
+        self.assertEqual(names, ['Lionel Messi', 'ronald', 'Kylian Mbappe'])
+
+        while self.manager.players:
+            self.manager.delete_player(0)
+        self.manager.add_player(PlayerRecord('p0', 'A', 8, 0))
+        self.manager.add_player(PlayerRecord('p1', 'A', 5, 0))
+        self.manager.add_player(PlayerRecord('p2', 'A', 0, 0))
+        self.manager.edit_player(0, PlayerRecord('', '', 5, None))
+        names = [player.name for player in self.manager.filter_by_goal_range(5, 5)]
+        self.assertEqual(names, ['p0', 'p1'])
+
+    def test_indexes_match_full_scan_after_random_edits(self):
+        rng = random.Random(1234)
+        teams = ['A', 'B', 'C']
+        for step in range(500):
+            action = rng.random()
+            if action < 0.5 or not self.manager.players:
+                self.manager.add_player(PlayerRecord(f'p{step}', rng.choice(teams),
+                                                     rng.randint(0, 5), rng.randint(0, 5)))
+            elif action < 0.8:
+                index = rng.randrange(len(self.manager.players))
+                self.manager.edit_player(index, PlayerRecord('', rng.choice(teams + ['']),
+                                                             rng.randint(0, 5), rng.randint(0, 5)))
+            else:
+                self.manager.delete_player(rng.randrange(len(self.manager.players)))
+
+            low = rng.randint(0, 5)
+            self.assert_goal_range_matches_sort(low, rng.randint(low, 5))
+            team = rng.choice(teams)
+            self.assertEqual([id(player) for player in self.manager.filter_by_team(team)],
+                             [id(player) for player in self.manager.players if player.team == team])
+
+
+if __name__ == '__main__':
+    unittest.main()